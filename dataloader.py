@@ -70,12 +70,13 @@ def remove_leading_slash(s):
 class DataLoadPreprocess(Dataset):
     def __init__(self, args, mode, transform=None, is_for_online_eval=False):
         self.args = args
+        # split each line once
         if mode == 'online_eval':
             with open(args.filenames_file_eval, 'r') as f:
-                self.filenames = f.readlines()
+                self.sample_fields = [line.split() for line in f.readlines()]
         else:
             with open(args.filenames_file, 'r') as f:
-                self.filenames = f.readlines()
+                self.sample_fields = [line.split() for line in f.readlines()]
 
         self.mode = mode
         self.transform = transform
@@ -83,16 +84,16 @@ class DataLoadPreprocess(Dataset):
         self.is_for_online_eval = is_for_online_eval
 
     def __getitem__(self, idx):
-        sample_path = self.filenames[idx]
-        focal = float(sample_path.split()[2])
+        sample_fields = self.sample_fields[idx]
+        focal = float(sample_fields[2])
 
         if self.mode == 'train':
             if self.args.dataset == 'kitti' and self.args.use_right is True and random.random() > 0.5:
-                image_path = os.path.join(self.args.data_path, remove_leading_slash(sample_path.split()[3]))
-                depth_path = os.path.join(self.args.gt_path, remove_leading_slash(sample_path.split()[4]))
+                image_path = os.path.join(self.args.data_path, remove_leading_slash(sample_fields[3]))
+                depth_path = os.path.join(self.args.gt_path, remove_leading_slash(sample_fields[4]))
             else:
-                image_path = os.path.join(self.args.data_path, remove_leading_slash(sample_path.split()[0]))
-                depth_path = os.path.join(self.args.gt_path, remove_leading_slash(sample_path.split()[1]))
+                image_path = os.path.join(self.args.data_path, remove_leading_slash(sample_fields[0]))
+                depth_path = os.path.join(self.args.gt_path, remove_leading_slash(sample_fields[1]))
 
             image = Image.open(image_path)
             depth_gt = Image.open(depth_path)
@@ -134,12 +135,12 @@ class DataLoadPreprocess(Dataset):
             else:
                 data_path = self.args.data_path
 
-            image_path = os.path.join(data_path, remove_leading_slash(sample_path.split()[0]))
+            image_path = os.path.join(data_path, remove_leading_slash(sample_fields[0]))
             image = np.asarray(Image.open(image_path), dtype=np.float32) / 255.0
 
             if self.mode == 'online_eval':
                 gt_path = self.args.gt_path_eval
-                depth_path = os.path.join(gt_path, remove_leading_slash(sample_path.split()[1]))
+                depth_path = os.path.join(gt_path, remove_leading_slash(sample_fields[1]))
                 has_valid_depth = False
                 try:
                     depth_gt = Image.open(depth_path)
@@ -167,7 +168,7 @@ class DataLoadPreprocess(Dataset):
 
             if self.mode == 'online_eval':
                 sample = {'image': image, 'depth': depth_gt, 'focal': focal, 'has_valid_depth': has_valid_depth,
-                          'image_path': sample_path.split()[0], 'depth_path': sample_path.split()[1]}
+                          'image_path': sample_fields[0], 'depth_path': sample_fields[1]}
             else:
                 sample = {'image': image, 'focal': focal}
 
@@ -219,15 +220,13 @@ class DataLoadPreprocess(Dataset):
 
         # color augmentation
         colors = np.random.uniform(0.9, 1.1, size=3)
-        white = np.ones((image.shape[0], image.shape[1]))
-        color_image = np.stack([white * colors[i] for i in range(3)], axis=2)
-        image_aug *= color_image
+        image_aug *= colors.reshape(1, 1, 3)
         image_aug = np.clip(image_aug, 0, 1)
 
         return image_aug
 
     def __len__(self):
-        return len(self.filenames)
+        return len(self.sample_fields)
 
 
 class ToTensor(object):